@@ -0,0 +1,76 @@
+"""Live board component
+
+Renders the metric grid, positions and signal cards inside one long-lived
+iframe. The stylesheet ships with the component (loaded once), and each rerun
+sends only the rows that changed since the previous tick; the frontend patches
+its DOM in place instead of Streamlit re-emitting the HTML.
+
+State is a dict of section -> {row_id: row}, where each row is a flat dict of
+pre-formatted display strings plus an `order` sort key. Known sections are
+"metrics", "positions" and "signals" (see frontend/main.js).
+"""
+import os
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+_FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend")
+_component = components.declare_component("live_board", path=_FRONTEND_DIR)
+
+
+def diff_state(old, new):
+    """Row-level diff of two board states: ({section: {id: row}}, {section: [id]})"""
+    changed = {}
+    removed = {}
+    for section, rows in new.items():
+        before = old.get(section, {})
+        patch = {row_id: row for row_id, row in rows.items() if before.get(row_id) != row}
+        gone = [row_id for row_id in before if row_id not in rows]
+        if patch:
+            changed[section] = patch
+        if gone:
+            removed[section] = gone
+    for section, rows in old.items():
+        if section not in new and rows:
+            removed[section] = list(rows)
+    return changed, removed
+
+
+def live_board(state, key):
+    """Render `state` through the component, sending only the diff since the last tick.
+
+    A full snapshot is sent on the first render of a session and whenever the
+    frontend reports it lost track (e.g. the iframe was remounted).
+    """
+    sent_key = f"_{key}_sent"
+    seq_key = f"_{key}_seq"
+    resync_key = f"_{key}_resync"
+
+    # The component value is the frontend's resync request, if any
+    ack = st.session_state.get(key)
+    resync = ack.get("resync") if isinstance(ack, dict) else None
+    full = sent_key not in st.session_state or (
+        resync is not None and resync != st.session_state.get(resync_key)
+    )
+    if resync is not None:
+        st.session_state[resync_key] = resync
+
+    previous_seq = st.session_state.get(seq_key, 0)
+    if full:
+        changed, removed = state, {}
+    else:
+        changed, removed = diff_state(st.session_state[sent_key], state)
+
+    # An idle tick is an empty patch on the current seq: live frames ignore it,
+    # and a freshly mounted frame sees the seq gap and asks for a resync
+    seq = previous_seq + 1 if full or changed or removed else previous_seq
+    st.session_state[sent_key] = state
+    st.session_state[seq_key] = seq
+    update = {
+        'seq': seq,
+        'base': None if full else previous_seq,
+        'sections': list(state),
+        'set': changed,
+        'unset': removed,
+    }
+    _component(update=update, key=key, default=None)
@@ -0,0 +1,214 @@
+// Live board frontend: applies the JSON state diffs sent by live_board() to the
+// DOM in place. Rows are keyed by id; only changed text and classes are touched.
+(function () {
+    'use strict';
+
+    const board = document.getElementById('board');
+    const mountId = Math.random().toString(36).slice(2);
+    let seq = 0;
+    let sections = {};
+    let resyncRequested = null;
+    let lastHeight = 0;
+
+    // Streamlit component protocol
+    function send(type, data) {
+        window.parent.postMessage(Object.assign({isStreamlitMessage: true, type: type}, data), '*');
+    }
+
+    function setFrameHeight() {
+        const height = board.offsetHeight + 8;
+        if (height !== lastHeight) {
+            lastHeight = height;
+            send('streamlit:setFrameHeight', {height: height});
+        }
+    }
+
+    function requestResync(update) {
+        if (resyncRequested === update.seq) return;
+        resyncRequested = update.seq;
+        send('streamlit:setComponentValue', {value: {resync: mountId + ':' + update.seq}, dataType: 'json'});
+    }
+
+    // DOM helpers
+    function el(tag, className, parent) {
+        const node = document.createElement(tag);
+        if (className) node.className = className;
+        if (parent) parent.appendChild(node);
+        return node;
+    }
+
+    function setText(node, text) {
+        text = text == null ? '' : String(text);
+        if (node.textContent !== text) node.textContent = text;
+    }
+
+    function setClass(node, className) {
+        if (node.className !== className) node.className = className;
+    }
+
+    // Row renderers: build() creates the nodes once, update() patches them
+    const metricRow = {
+        build: function () {
+            const root = el('div', 'metric-card');
+            return {
+                root: root,
+                label: el('div', 'metric-label', root),
+                value: el('div', 'metric-value', root),
+                delta: el('div', 'metric-delta', root),
+            };
+        },
+        update: function (refs, row) {
+            setText(refs.label, row.label);
+            setText(refs.value, row.value);
+            setClass(refs.value, 'metric-value' + (row.tone ? ' ' + row.tone : ''));
+            refs.value.style.color = row.color || '';
+            setText(refs.delta, row.delta);
+            refs.delta.style.display = row.delta ? '' : 'none';
+        },
+    };
+
+    const positionRow = {
+        build: function () {
+            const root = el('div', 'position-row');
+            const layout = el('div', 'card-layout', root);
+            const info = el('div', '', layout);
+            const quote = el('div', 'position-quote', layout);
+            return {
+                root: root,
+                symbol: el('div', 'position-symbol', info),
+                entry: el('div', 'position-entry', info),
+                criteria: el('div', 'position-criteria', info),
+                price: el('div', 'position-price', quote),
+                pnl: el('div', 'position-pnl', quote),
+            };
+        },
+        update: function (refs, row) {
+            setText(refs.symbol, row.symbol);
+            setText(refs.entry, row.entry);
+            setText(refs.criteria, row.criteria);
+            setText(refs.price, row.price);
+            setText(refs.pnl, row.pnl);
+            setClass(refs.pnl, 'position-pnl ' + (row.tone || ''));
+        },
+    };
+
+    const signalRow = {
+        build: function () {
+            const root = el('div', 'signal-card');
+            const layout = el('div', 'card-layout', root);
+            const info = el('div', '', layout);
+            const when = el('div', 'signal-time', layout);
+            return {
+                root: root,
+                title: el('span', 'signal-title', info),
+                price: el('span', 'signal-price', info),
+                time: el('div', '', when),
+                session: el('div', 'signal-session', when),
+            };
+        },
+        update: function (refs, row) {
+            setClass(refs.root, 'signal-card ' + (row.kind || 'signal-hold'));
+            setText(refs.title, row.title);
+            setText(refs.price, row.price);
+            setText(refs.time, row.time);
+            setText(refs.session, row.session);
+        },
+    };
+
+    const SECTIONS = {
+        metrics: {renderer: metricRow, list: 'metric-grid'},
+        positions: {renderer: positionRow, header: '📊 Active Positions', list: 'glass-card',
+                    empty: 'No active positions', emptyClass: 'section-empty'},
+        signals: {renderer: signalRow, header: '📡 Recent Signals',
+                  empty: 'No signals today', emptyClass: 'glass-card section-empty'},
+    };
+
+    function createSection(name) {
+        const spec = SECTIONS[name];
+        if (!spec) return null;
+        const root = el('div', '', board);
+        if (spec.header) setText(el('div', 'section-header', root), spec.header);
+        const list = el('div', spec.list || '', root);
+        let empty = null;
+        if (spec.empty) {
+            empty = el('div', spec.emptyClass, spec.list ? list : root);
+            setText(empty, spec.empty);
+        }
+        return {spec: spec, list: list, empty: empty, rows: new Map()};
+    }
+
+    function reorder(section) {
+        const entries = Array.from(section.rows.values());
+        entries.sort(function (a, b) { return a.order < b.order ? -1 : a.order > b.order ? 1 : 0; });
+        let expected = section.list.firstElementChild;
+        for (const entry of entries) {
+            if (entry.refs.root !== expected) {
+                section.list.insertBefore(entry.refs.root, expected);
+            } else {
+                expected = expected.nextElementSibling;
+            }
+        }
+    }
+
+    function patchSection(section, set, unset) {
+        let moved = false;
+        for (const id of unset || []) {
+            const entry = section.rows.get(id);
+            if (entry) {
+                entry.refs.root.remove();
+                section.rows.delete(id);
+            }
+        }
+        for (const id of Object.keys(set || {})) {
+            const row = set[id];
+            let entry = section.rows.get(id);
+            if (!entry) {
+                entry = {refs: section.spec.renderer.build(), order: row.order};
+                section.rows.set(id, entry);
+                section.list.appendChild(entry.refs.root);
+                moved = true;
+            } else if (entry.order !== row.order) {
+                entry.order = row.order;
+                moved = true;
+            }
+            section.spec.renderer.update(entry.refs, row);
+        }
+        if (moved) reorder(section);
+        if (section.empty) {
+            section.empty.style.display = section.rows.size ? 'none' : '';
+            if (section.empty.parentNode === section.list) section.list.appendChild(section.empty);
+        }
+    }
+
+    function apply(update) {
+        if (!update) return;
+        if (update.base === null) {
+            if (update.seq === seq) return;
+            board.textContent = '';
+            sections = {};
+            for (const name of update.sections) {
+                const section = createSection(name);
+                if (section) sections[name] = section;
+            }
+        } else {
+            if (update.seq <= seq) return;
+            if (update.base !== seq) {
+                requestResync(update);
+                return;
+            }
+        }
+        for (const name of Object.keys(sections)) {
+            patchSection(sections[name], (update.set || {})[name], (update.unset || {})[name]);
+        }
+        seq = update.seq;
+        setFrameHeight();
+    }
+
+    window.addEventListener('message', function (event) {
+        const data = event.data;
+        if (data && data.type === 'streamlit:render') apply(data.args.update);
+    });
+
+    if (window.ResizeObserver) new ResizeObserver(setFrameHeight).observe(board);
+    send('streamlit:componentReady', {apiVersion: 1});
+})();
@@ -0,0 +1,376 @@
+"""Multi-viewer load test for streamlit_dashboard.py
+
+Starts a local stand-in for the GitHub raw data host (serving the JSON files
+in this repo), launches the dashboard with `streamlit run` pointed at it, and
+drives N headless viewer sessions over the Streamlit websocket.
+
+Reports:
+  - per-session refresh latency percentiles (script start -> last element)
+  - server CPU % and RSS over time
+  - failed (never connected) and dropped sessions per level
+  - fixed vs per-session (duplicated) USS, fitted across levels from
+    /proc/<pid>/smaps_rollup
+
+Give --sessions in ascending order: freed Python heap is not returned to the
+OS, so a level run after a larger one still carries its memory and the
+fixed/per-session fit becomes meaningless.
+
+Usage:
+    python load_test.py --sessions 1 5 10 20 --duration 60
+    python load_test.py --sessions 10 --json results.json
+"""
+import argparse
+import asyncio
+import glob
+import http.server
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+
+import numpy as np
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+DASHBOARD = os.path.join(REPO_DIR, "streamlit_dashboard.py")
+CLK_TCK = os.sysconf("SC_CLK_TCK")
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+# Streamlit keeps disconnected sessions (and their state) for this long; the
+# default is 120s, which would leak one level's sessions into the next
+DISCONNECTED_SESSION_TTL = 1
+
+
+# Stand-in data server
+class DataHandler(http.server.SimpleHTTPRequestHandler):
+    """Serve repo JSON files; map today's signals file to the newest one on disk"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=REPO_DIR, **kwargs)
+
+    def translate_path(self, path):
+        local = super().translate_path(path)
+        name = os.path.basename(local)
+        if name.startswith("signals_") and not os.path.exists(local):
+            available = sorted(glob.glob(os.path.join(REPO_DIR, "signals", "signals_*.json")))
+            if available:
+                return available[-1]
+        return local
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_data_server(port):
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", port), DataHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+# Dashboard server process
+def start_dashboard(port, data_base):
+    # Keep reloading data every tick even outside market hours so results are comparable,
+    # and start from an empty price tape rather than one saved by a real dashboard
+    tape_file = os.path.join(tempfile.mkdtemp(prefix="load_test_"), "price_tape.json")
+    env = dict(os.environ, DASHBOARD_DATA_BASE=data_base, DASHBOARD_CLOSED_REFRESH="5",
+               DASHBOARD_TAPE_FILE=tape_file)
+    cmd = [
+        sys.executable, "-m", "streamlit", "run", DASHBOARD,
+        "--server.headless", "true",
+        "--server.port", str(port),
+        "--server.address", "127.0.0.1",
+        "--server.fileWatcherType", "none",
+        "--server.disconnectedSessionTTL", str(DISCONNECTED_SESSION_TTL),
+        "--browser.gatherUsageStats", "false",
+    ]
+    return subprocess.Popen(cmd, env=env, cwd=REPO_DIR,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def wait_for_health(port, timeout=60):
+    url = f"http://127.0.0.1:{port}/_stcore/health"
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=2) as resp:
+                if resp.status == 200:
+                    return True
+        except OSError:
+            pass
+        time.sleep(0.5)
+    return False
+
+
+# Process sampling
+def read_cpu_seconds(pid):
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    # utime and stime are fields 14 and 15 of /proc/<pid>/stat
+    return (int(fields[11]) + int(fields[12])) / CLK_TCK
+
+
+def read_memory(pid):
+    """RSS/PSS/USS and shared page counts in MB from smaps_rollup"""
+    mem = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) >= 3 and parts[2] == "kB":
+                    mem[parts[0].rstrip(":")] = int(parts[1]) / 1024
+    except FileNotFoundError:
+        with open(f"/proc/{pid}/statm") as f:
+            _, resident, shared = f.read().split()[:3]
+        mem["Rss"] = int(resident) * PAGE_SIZE / 2**20
+        mem["Shared_Clean"] = int(shared) * PAGE_SIZE / 2**20
+    return {
+        'rss': mem.get("Rss", 0),
+        'pss': mem.get("Pss", 0),
+        'uss': mem.get("Private_Clean", 0) + mem.get("Private_Dirty", 0),
+        'shared': mem.get("Shared_Clean", 0) + mem.get("Shared_Dirty", 0),
+    }
+
+
+class ProcessSampler(threading.Thread):
+    """Samples CPU % and memory of the dashboard process at a fixed interval"""
+
+    def __init__(self, pid, interval=1.0):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.samples = []
+        self.sessions = 0
+        self._stop_event = threading.Event()
+
+    def run(self):
+        start = time.time()
+        last_cpu = read_cpu_seconds(self.pid)
+        last_t = time.time()
+        while not self._stop_event.wait(self.interval):
+            try:
+                cpu = read_cpu_seconds(self.pid)
+                mem = read_memory(self.pid)
+            except (FileNotFoundError, ProcessLookupError):
+                break
+            now = time.time()
+            self.samples.append({
+                't': round(now - start, 2),
+                'sessions': self.sessions,
+                'cpu_pct': round((cpu - last_cpu) / (now - last_t) * 100, 1),
+                **{k: round(v, 1) for k, v in mem.items()},
+            })
+            last_cpu, last_t = cpu, now
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+# Headless viewer sessions
+async def run_session(port, stop_event, stats):
+    """One viewer: connect, request a run and time every refresh until stopped"""
+    import websockets
+    from streamlit.proto.BackMsg_pb2 import BackMsg
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+    url = f"ws://127.0.0.1:{port}/_stcore/stream"
+    async with websockets.connect(url, subprotocols=["streamlit"], max_size=None) as ws:
+        stats['connected'] = True
+        back = BackMsg()
+        back.rerun_script.query_string = ""
+        back.rerun_script.page_script_hash = ""
+        await ws.send(back.SerializeToString())
+
+        run_start = last_delta = None
+        run_bytes = 0
+
+        def finish_run():
+            if run_start is not None and last_delta is not None:
+                stats['latencies'].append(last_delta - run_start)
+                stats['bytes'].append(run_bytes)
+
+        while not stop_event.is_set():
+            try:
+                raw = await asyncio.wait_for(ws.recv(), timeout=1.0)
+            except asyncio.TimeoutError:
+                continue
+            now = time.perf_counter()
+            msg = ForwardMsg()
+            msg.ParseFromString(raw)
+            kind = msg.WhichOneof("type")
+
+            if kind == "new_session":
+                finish_run()
+                run_start, last_delta, run_bytes = now, None, 0
+            elif kind == "delta":
+                last_delta = now
+            elif kind == "script_finished":
+                finish_run()
+                run_start = last_delta = None
+            run_bytes += len(raw)
+
+
+async def drive_sessions(port, count, duration, sampler, all_stats):
+    stop_event = asyncio.Event()
+    tasks = []
+    for _ in range(count):
+        stats = {'latencies': [], 'bytes': [], 'connected': False, 'error': None}
+        all_stats.append(stats)
+        tasks.append(asyncio.create_task(run_session(port, stop_event, stats)))
+        sampler.sessions += 1
+        await asyncio.sleep(0.1)
+    await asyncio.sleep(duration)
+    stop_event.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    sampler.sessions = 0
+    for stats, result in zip(all_stats, results):
+        if isinstance(result, BaseException):
+            stats['error'] = f"{type(result).__name__}: {result}"
+
+
+# Reporting
+def percentiles(values):
+    if not values:
+        return {'n': 0}
+    p50, p90, p99 = np.percentile(values, [50, 90, 99])
+    return {'n': len(values), 'p50': p50, 'p90': p90, 'p99': p99, 'max': max(values)}
+
+
+def summarize_level(count, stats, samples):
+    latencies = [x for s in stats for x in s['latencies']]
+    run_bytes = [x for s in stats for x in s['bytes']]
+    per_session_p50 = [np.percentile(s['latencies'], 50) for s in stats if s['latencies']]
+    level = [s for s in samples if s['sessions'] == count]
+    # Memory is taken from the second half of the window, once sessions are warm
+    steady = level[len(level) // 2:] or level
+    # Failed sessions never connected; dropped ones connected and then errored
+    failed = [s for s in stats if s['error'] and not s['connected']]
+    dropped = [s for s in stats if s['error'] and s['connected']]
+    errors = {}
+    for s in failed + dropped:
+        errors[s['error']] = errors.get(s['error'], 0) + 1
+    return {
+        'sessions': count,
+        'failed_sessions': len(failed),
+        'dropped_sessions': len(dropped),
+        'errors': errors,
+        'latency_ms': {k: (v * 1000 if k != 'n' else v) for k, v in percentiles(latencies).items()},
+        'session_p50_spread_ms': [min(per_session_p50) * 1000, max(per_session_p50) * 1000] if per_session_p50 else None,
+        'refreshes_per_session': len(latencies) / count if count else 0,
+        'bytes_per_refresh': float(np.mean(run_bytes)) if run_bytes else 0,
+        'cpu_pct': float(np.mean([s['cpu_pct'] for s in level])) if level else 0,
+        'cpu_pct_max': max((s['cpu_pct'] for s in level), default=0),
+        'rss_mb': float(np.mean([s['rss'] for s in steady])) if steady else 0,
+        'uss_mb': float(np.mean([s['uss'] for s in steady])) if steady else 0,
+        'shared_pages_mb': float(np.mean([s['shared'] for s in steady])) if steady else 0,
+    }
+
+
+def memory_split(levels):
+    """Fit USS = fixed + per_session * N across levels.
+
+    The intercept is private memory every viewer shares (interpreter, imported
+    libraries, caches); the slope is memory duplicated for each session. This
+    is separate from the per-level `shared_pages_mb`, which counts pages the
+    process shares with other processes (smaps Shared_*).
+    """
+    xs = [lvl['sessions'] for lvl in levels]
+    ys = [lvl['uss_mb'] for lvl in levels]
+    if len(set(xs)) < 2:
+        return None
+    slope, intercept = np.polyfit(xs, ys, 1)
+    return {'fixed_uss_mb': float(intercept), 'per_session_uss_mb': float(slope)}
+
+
+def print_report(levels, split):
+    print()
+    print(f"{'sessions':>8} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8} "
+          f"{'fail':>5} {'drop':>5} {'runs':>7} {'KB/run':>7} {'cpu %':>7} "
+          f"{'rss MB':>8} {'uss MB':>8} {'shr MB':>8}")
+    for lvl in levels:
+        lat = lvl['latency_ms']
+        print(f"{lvl['sessions']:>8} {lat.get('p50', 0):>8.0f} {lat.get('p90', 0):>8.0f} "
+              f"{lat.get('p99', 0):>8.0f} {lat.get('max', 0):>8.0f} "
+              f"{lvl['failed_sessions']:>5} {lvl['dropped_sessions']:>5} "
+              f"{lvl['refreshes_per_session']:>7.1f} {lvl['bytes_per_refresh'] / 1024:>7.1f} "
+              f"{lvl['cpu_pct']:>7.1f} {lvl['rss_mb']:>8.1f} {lvl['uss_mb']:>8.1f} {lvl['shared_pages_mb']:>8.1f}")
+    print("fail = never connected, drop = connected then errored; "
+          "shr MB = pages shared with other processes")
+    for lvl in levels:
+        for error, n in lvl['errors'].items():
+            print(f"  {lvl['sessions']} sessions: {n}x {error}")
+    print()
+    if split:
+        print(f"Fixed USS, shared by all sessions: {split['fixed_uss_mb']:.1f} MB")
+        print(f"Duplicated USS per session:        {split['per_session_uss_mb']:.2f} MB")
+    else:
+        print("Run at least two session counts to split shared vs per-session memory")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the signals dashboard")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 5, 10],
+                        help="Concurrent viewer counts to run, one level each, ascending")
+    parser.add_argument("--duration", type=float, default=60,
+                        help="Seconds to hold each level")
+    parser.add_argument("--interval", type=float, default=1.0,
+                        help="Server CPU/memory sampling interval in seconds")
+    parser.add_argument("--port", type=int, default=0, help="Dashboard port (default: free port)")
+    parser.add_argument("--data-port", type=int, default=0, help="Data server port (default: free port)")
+    parser.add_argument("--json", help="Write the full results (incl. time series) to this file")
+    args = parser.parse_args()
+    if args.sessions != sorted(args.sessions):
+        print("Warning: --sessions is not ascending; the memory fit will be skewed", file=sys.stderr)
+
+    data_port = args.data_port or free_port()
+    port = args.port or free_port()
+    data_server = start_data_server(data_port)
+    proc = start_dashboard(port, f"http://127.0.0.1:{data_port}")
+
+    try:
+        if not wait_for_health(port):
+            print("Dashboard server did not become healthy", file=sys.stderr)
+            return 1
+        print(f"Dashboard pid {proc.pid} on :{port}, data server on :{data_port}")
+
+        sampler = ProcessSampler(proc.pid, args.interval)
+        sampler.start()
+        levels = []
+        for count in args.sessions:
+            print(f"Running {count} session(s) for {args.duration:.0f}s...")
+            stats = []
+            asyncio.run(drive_sessions(port, count, args.duration, sampler, stats))
+            levels.append(summarize_level(count, stats, sampler.samples))
+            # Wait out the disconnected-session TTL before the next level connects
+            time.sleep(max(2 * args.interval, DISCONNECTED_SESSION_TTL + 1))
+        sampler.stop()
+
+        split = memory_split(levels)
+        print_report(levels, split)
+
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump({'levels': levels, 'memory_split': split,
+                           'samples': sampler.samples}, f, indent=2)
+            print(f"Results written to {args.json}")
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+        data_server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+"""US equity market calendar
+
+Precomputes NYSE session boundaries (weekends, holidays and 1pm early closes)
+for a range of years into per-day arrays, so status lookups are O(1) and
+trade/signal timestamps can be labeled by session in one vectorized pass.
+"""
+from datetime import date, datetime, time, timedelta
+
+import numpy as np
+import pandas as pd
+import pytz
+
+ET = pytz.timezone('US/Eastern')
+
+# Session labels
+PRE_MARKET = "PRE-MARKET"
+REGULAR = "REGULAR"
+AFTER_HOURS = "AFTER-HOURS"
+CLOSED = "CLOSED"
+
+# Day types
+TRADING_DAY = "TRADING DAY"
+EARLY_CLOSE = "EARLY CLOSE"
+WEEKEND = "WEEKEND"
+HOLIDAY = "HOLIDAY"
+
+# Session boundaries in minutes after midnight ET
+PRE_MARKET_OPEN = 4 * 60
+REGULAR_OPEN = 9 * 60 + 30
+REGULAR_CLOSE = 16 * 60
+EARLY_CLOSE_TIME = 13 * 60
+EXTENDED_HOURS = 4 * 60  # after-hours runs four hours past the close
+
+# Unscheduled closures (national days of mourning)
+SPECIAL_CLOSURES = {
+    date(2018, 12, 5),
+    date(2025, 1, 9),
+}
+
+_DAY_TYPES = np.array([TRADING_DAY, EARLY_CLOSE, WEEKEND, HOLIDAY], dtype=object)
+_SESSIONS = np.array([PRE_MARKET, REGULAR, AFTER_HOURS, CLOSED], dtype=object)
+
+
+def _nth_weekday(year, month, weekday, n):
+    """n-th given weekday of a month (n = -1 for the last one)"""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _observed(day):
+    """Saturday holidays move to Friday, Sunday holidays to Monday"""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+def _easter(year):
+    # Anonymous Gregorian algorithm
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def nyse_holidays(year):
+    """Full-day NYSE holidays for a year"""
+    holidays = {
+        _nth_weekday(year, 1, 0, 3),             # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),             # Washington's Birthday
+        _easter(year) - timedelta(days=2),       # Good Friday
+        _nth_weekday(year, 5, 0, -1),            # Memorial Day
+        _observed(date(year, 7, 4)),             # Independence Day
+        _nth_weekday(year, 9, 0, 1),             # Labor Day
+        _nth_weekday(year, 11, 3, 4),            # Thanksgiving
+        _observed(date(year, 12, 25)),           # Christmas
+    }
+    # New Year's Day on a Saturday is not observed on the prior Friday
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays.add(_observed(new_year))
+    if year >= 2022:
+        holidays.add(_observed(date(year, 6, 19)))  # Juneteenth
+    holidays.update(d for d in SPECIAL_CLOSURES if d.year == year)
+    return holidays
+
+
+def nyse_early_closes(year):
+    """1pm ET early-close days for a year"""
+    days = {_nth_weekday(year, 11, 3, 4) + timedelta(days=1)}  # Day after Thanksgiving
+    for day in (date(year, 7, 3), date(year, 12, 24)):
+        if day.weekday() < 4:
+            days.add(day)
+    return days - nyse_holidays(year)
+
+
+class MarketCalendar:
+    """NYSE sessions precomputed for [start_year, end_year].
+
+    Dates outside the range fall back to weekday-only rules.
+    """
+
+    def __init__(self, start_year=2020, end_year=2035):
+        self.start = date(start_year, 1, 1)
+        self.end = date(end_year, 12, 31)
+        days = np.arange(np.datetime64(self.start), np.datetime64(self.end) + 1)
+
+        # 1970-01-01 was a Thursday
+        weekday = (days.astype(np.int64) + 3) % 7
+        self.day_kind = np.where(weekday >= 5, 2, 0).astype(np.int8)
+        self.close = np.full(len(days), REGULAR_CLOSE, dtype=np.int16)
+
+        for year in range(start_year, end_year + 1):
+            for day in nyse_early_closes(year):
+                self.day_kind[self._index(day)] = 1
+                self.close[self._index(day)] = EARLY_CLOSE_TIME
+            for day in nyse_holidays(year):
+                if self.start <= day <= self.end and day.weekday() < 5:
+                    self.day_kind[self._index(day)] = 3
+
+    def _index(self, day):
+        return (day - self.start).days
+
+    def _lookup(self, day):
+        if self.start <= day <= self.end:
+            i = self._index(day)
+            return int(self.day_kind[i]), int(self.close[i])
+        return (2 if day.weekday() >= 5 else 0), REGULAR_CLOSE
+
+    def day_type(self, ts):
+        """TRADING_DAY, EARLY_CLOSE, WEEKEND or HOLIDAY for a datetime (or date)"""
+        day = ts.astimezone(ET).date() if isinstance(ts, datetime) else ts
+        return _DAY_TYPES[self._lookup(day)[0]]
+
+    def session_at(self, ts):
+        """Session label for one tz-aware datetime"""
+        local = ts.astimezone(ET)
+        kind, close = self._lookup(local.date())
+        if kind >= 2:
+            return CLOSED
+        minute = local.hour * 60 + local.minute
+        if minute < PRE_MARKET_OPEN:
+            return CLOSED
+        if minute < REGULAR_OPEN:
+            return PRE_MARKET
+        if minute < close:
+            return REGULAR
+        if minute < close + EXTENDED_HOURS:
+            return AFTER_HOURS
+        return CLOSED
+
+    def next_session_start(self, ts):
+        """Start of the next pre-market session after a tz-aware datetime"""
+        local = ts.astimezone(ET)
+        day = local.date()
+        if local.hour * 60 + local.minute >= PRE_MARKET_OPEN:
+            day += timedelta(days=1)
+        while self._lookup(day)[0] >= 2:
+            day += timedelta(days=1)
+        return ET.localize(datetime.combine(day, time(PRE_MARKET_OPEN // 60)))
+
+    def label_sessions(self, timestamps):
+        """Vectorized session labels for an array of timestamps.
+
+        Naive timestamps are taken as UTC, like the trading system writes them;
+        missing or unparseable ones are labeled CLOSED.
+        """
+        stamps = pd.to_datetime(pd.Series(timestamps), utc=True, format='ISO8601', errors='coerce')
+        stamps = stamps.dt.tz_convert(ET)
+        labels = np.full(len(stamps), CLOSED, dtype=object)
+        valid = stamps.notna().to_numpy()
+        if valid.any():
+            local = stamps[valid]
+            days = local.dt.tz_localize(None).dt.normalize().to_numpy().astype('datetime64[D]')
+            index = (days - np.datetime64(self.start)).astype(np.int64)
+            in_range = (index >= 0) & (index < len(self.day_kind))
+            safe = np.clip(index, 0, len(self.day_kind) - 1)
+
+            weekend = local.dt.weekday.to_numpy() >= 5
+            kind = np.where(in_range, self.day_kind[safe], np.where(weekend, 2, 0))
+            close = np.where(in_range, self.close[safe], REGULAR_CLOSE)
+            minute = (local.dt.hour * 60 + local.dt.minute).to_numpy()
+
+            session = np.select(
+                [
+                    (kind >= 2) | (minute < PRE_MARKET_OPEN),
+                    minute < REGULAR_OPEN,
+                    minute < close,
+                    minute < close + EXTENDED_HOURS,
+                ],
+                [3, 0, 1, 2],
+                default=3,
+            )
+            labels[valid] = _SESSIONS[session]
+        return labels
+
+
+NYSE = MarketCalendar()
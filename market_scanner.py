@@ -0,0 +1,254 @@
+"""Market-wide movers scanner
+
+Computes % change, range position and signal activity for every symbol in the
+realtime price feed as numpy arrays, and ranks them with partial-sort top-k so
+the watchlist stays cheap as the universe grows to thousands of symbols.
+"""
+import json
+import os
+import threading
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from market_calendar import ET
+
+TAPE_CAPACITY = 720  # snapshots kept per symbol, one per new feed timestamp
+
+
+class PriceTape:
+    """Rolling window of price snapshots, one column per symbol.
+
+    The feed only carries the latest price, so reference/high/low prices come
+    from snapshots recorded here. One tape is shared by all viewer sessions.
+
+    With a `path`, the latest snapshot and the previous ET day's last snapshot
+    are saved there and replayed on startup, so a restarted app (or one whose
+    feed has stopped updating) still has a baseline to measure movers against.
+    """
+
+    def __init__(self, capacity=TAPE_CAPACITY, path=None):
+        self.capacity = capacity
+        self.path = path
+        self.columns = {}
+        self.data = np.full((capacity, 0), np.nan)
+        self.stamps = np.full(capacity, None, dtype=object)
+        self.rows = 0
+        self.last_timestamp = None
+        self.last_prices = None
+        self.close = None  # (timestamp, prices) last recorded on an earlier ET day
+        self._stats = None
+        self._lock = threading.Lock()
+        if path:
+            self._load()
+
+    @property
+    def baseline_timestamp(self):
+        """Timestamp of the oldest snapshot in the window, or None if empty"""
+        if self.rows == 0:
+            return None
+        return self.stamps[self.rows % self.capacity if self.rows >= self.capacity else 0]
+
+    def record(self, timestamp, prices):
+        """Append one snapshot if it is newer than the last one recorded.
+
+        Every viewer session calls this, so repeated or older feed timestamps
+        (e.g. a lagging cached response) are ignored, as are snapshots whose
+        timestamp is missing or unparseable.
+        """
+        stamp = _parse_timestamp(timestamp)
+        if not prices or stamp is None:
+            return
+        with self._lock:
+            if self._append(stamp, prices) and self.path:
+                self._save()
+
+    def _append(self, stamp, prices):
+        if self.last_timestamp is not None:
+            if stamp <= self.last_timestamp:
+                return False
+            if stamp.astimezone(ET).date() > self.last_timestamp.astimezone(ET).date():
+                self.close = (self.last_timestamp, self.last_prices)
+        self.last_timestamp = stamp
+        self.last_prices = dict(prices)
+
+        new = [s for s in prices if s not in self.columns]
+        if new:
+            for sym in new:
+                self.columns[sym] = len(self.columns)
+            pad = np.full((self.capacity, len(new)), np.nan)
+            self.data = np.hstack([self.data, pad])
+
+        row = self.rows % self.capacity
+        self.data[row] = np.nan
+        idx = np.fromiter((self.columns[s] for s in prices), dtype=np.intp, count=len(prices))
+        self.data[row, idx] = np.fromiter(prices.values(), dtype=float, count=len(prices))
+        self.stamps[row] = stamp
+        self.rows += 1
+        self._stats = None
+        return True
+
+    def _save(self):
+        snapshots = {'close': self.close, 'last': (self.last_timestamp, self.last_prices)}
+        state = {
+            name: {'timestamp': snap[0].isoformat(), 'prices': snap[1]}
+            for name, snap in snapshots.items() if snap is not None
+        }
+        # Write-then-rename so a crash mid-write never leaves a torn file
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, 'w') as f:
+                json.dump(state, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(state, dict):
+            return
+        for name in ('close', 'last'):
+            snap = state.get(name)
+            if not isinstance(snap, dict) or not isinstance(snap.get('prices'), dict):
+                continue
+            stamp = _parse_timestamp(snap.get('timestamp'))
+            if stamp is not None and snap['prices']:
+                self._append(stamp, snap['prices'])
+
+    def window(self, symbols):
+        """Return (first, low, high) arrays aligned with `symbols`, NaN where unseen"""
+        n = len(symbols)
+        with self._lock:
+            if self._stats is None:
+                self._stats = self._column_stats()
+            first, low, high = self._stats
+            idx = np.fromiter((self.columns.get(s, -1) for s in symbols), dtype=np.intp, count=n)
+
+        known = idx >= 0
+        out = np.full((3, n), np.nan)
+        out[0, known] = first[idx[known]]
+        out[1, known] = low[idx[known]]
+        out[2, known] = high[idx[known]]
+        return out[0], out[1], out[2]
+
+    def _column_stats(self):
+        # Recomputed once per new snapshot and then shared by every scan
+        if self.rows < self.capacity:
+            data = self.data[:self.rows]
+        else:
+            start = self.rows % self.capacity
+            data = np.concatenate([self.data[start:], self.data[:start]])
+        if len(data) == 0:
+            empty = np.full(len(self.columns), np.nan)
+            return empty, empty, empty
+        seen = ~np.isnan(data)
+        first = data[seen.argmax(axis=0), np.arange(data.shape[1])]
+        return first, np.fmin.reduce(data, axis=0), np.fmax.reduce(data, axis=0)
+
+
+def _parse_timestamp(timestamp):
+    """Feed timestamp as an aware datetime (naive is UTC), or None"""
+    try:
+        dt = datetime.fromisoformat(str(timestamp).replace('Z', '+00:00'))
+    except (TypeError, ValueError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def top_k(values, k, largest=True):
+    """Indices of the k largest (or smallest) values, NaNs last, O(n + k log k)"""
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    if n == 0 or k <= 0:
+        return np.array([], dtype=np.intp)
+    keys = -values if largest else values.copy()
+    keys[np.isnan(keys)] = np.inf
+    k = min(k, n)
+    part = np.argpartition(keys, k - 1)[:k] if k < n else np.arange(n)
+    order = part[np.argsort(keys[part], kind='stable')]
+    return order[np.isfinite(keys[order])]
+
+
+def scan_universe(prices, signals=None, tape=None):
+    """Vectorized movers table for every symbol in the price feed.
+
+    Columns: symbol, price, change_pct, range_pos (0 = window low,
+    1 = window high), signals, longs, exits.
+
+    change_pct is measured for every symbol from the same baseline, the first
+    price in the tape window, so gainers and losers rank comparably. Today's
+    signal prices only widen the low/high used for range_pos.
+    """
+    symbols = np.array(list(prices), dtype=object)
+    last = np.fromiter(prices.values(), dtype=float, count=len(symbols))
+
+    if tape is not None:
+        ref, low, high = tape.window(symbols)
+    else:
+        ref = np.full(len(symbols), np.nan)
+        low, high = ref.copy(), ref.copy()
+
+    n = len(symbols)
+    sig_count = np.zeros(n, dtype=int)
+    long_count = np.zeros(n, dtype=int)
+    exit_count = np.zeros(n, dtype=int)
+
+    if signals and n:
+        sig_symbols = np.array([str(s.get('symbol')) for s in signals])
+        actions = np.array([str(s.get('action')) for s in signals])
+        sig_prices = np.array([s.get('price') for s in signals], dtype=float)
+
+        # One sort over feed + signal symbols gives shared codes; map each
+        # signal's code back to its position in `symbols` (-1 if not in feed)
+        _, codes = np.unique(np.concatenate([symbols.astype(str), sig_symbols]), return_inverse=True)
+        position = np.full(codes.max() + 1, -1, dtype=np.intp)
+        position[codes[:n]] = np.arange(n)
+        pos = position[codes[n:]]
+        keep = pos >= 0
+        pos, actions, sig_prices = pos[keep], actions[keep], sig_prices[keep]
+
+        sig_count = np.bincount(pos, minlength=n)
+        long_count = np.bincount(pos, weights=actions == 'LONG', minlength=n).astype(int)
+        exit_count = np.bincount(pos, weights=actions == 'EXIT', minlength=n).astype(int)
+
+        low, high = low.copy(), high.copy()
+        np.fmin.at(low, pos, sig_prices)
+        np.fmax.at(high, pos, sig_prices)
+
+    valid = last > 0
+    low = np.fmin(low, np.where(valid, last, np.nan))
+    high = np.fmax(high, np.where(valid, last, np.nan))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        change_pct = np.where(valid & (ref > 0), (last - ref) / ref * 100, np.nan)
+        span = high - low
+        range_pos = np.where(valid & (span > 0), (last - low) / span, np.nan)
+
+    return pd.DataFrame({
+        'symbol': symbols,
+        'price': last,
+        'change_pct': change_pct,
+        'range_pos': range_pos,
+        'signals': sig_count,
+        'longs': long_count,
+        'exits': exit_count,
+    })
+
+
+def rank_movers(scan, k=5):
+    """Top gainers, losers and most-signalled symbols from a scan table"""
+    change = scan['change_pct'].to_numpy()
+    activity = scan['signals'].to_numpy(dtype=float)
+    activity[activity == 0] = np.nan
+    return {
+        'gainers': scan.iloc[top_k(np.where(change > 0, change, np.nan), k, largest=True)],
+        'losers': scan.iloc[top_k(np.where(change < 0, change, np.nan), k, largest=False)],
+        'signalled': scan.iloc[top_k(activity, k, largest=True)],
+    }
@@ -9,6 +9,11 @@ import pytz
 import requests
 import random
 import hashlib
+import os
+import threading
+from market_scanner import PriceTape, scan_universe, rank_movers
+from live_board import live_board
+from market_calendar import NYSE, PRE_MARKET, REGULAR, AFTER_HOURS, CLOSED, WEEKEND, HOLIDAY
 
 # Page configuration
 st.set_page_config(
@@ -20,9 +25,15 @@ st.set_page_config(
 
 # Constants
 ASSETS = ['TSLA', 'HOOD', 'COIN', 'PLTR', 'AAPL']
-WATCHLIST = ['NVDA', 'AMD', 'META', 'GOOGL', 'MSFT']
+WATCHLIST_SIZE = 4
+REFRESH_SECONDS = 5
+CLOSED_REFRESH_SECONDS = int(os.environ.get("DASHBOARD_CLOSED_REFRESH", 60))
 ET = pytz.timezone('US/Eastern')
-GITHUB_RAW_BASE = "https://raw.githubusercontent.com/omarpagz01/ml-trading-dashboard/main"
+TAPE_FILE = os.environ.get("DASHBOARD_TAPE_FILE", ".price_tape.json")
+GITHUB_RAW_BASE = os.environ.get(
+    "DASHBOARD_DATA_BASE",
+    "https://raw.githubusercontent.com/omarpagz01/ml-trading-dashboard/main"
+)
 
 # Initialize session state
 if 'counter' not in st.session_state:
@@ -103,170 +114,6 @@ st.markdown("""
         50% { opacity: 0.7; transform: scale(1.1); }
     }
     
-    /* Metric Cards */
-    .metric-grid {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(140px, 1fr));
-        gap: 1rem;
-        margin-bottom: 2rem;
-    }
-    
-    .metric-card {
-        background: linear-gradient(135deg, rgba(255,255,255,0.05) 0%, rgba(255,255,255,0.02) 100%);
-        backdrop-filter: blur(20px);
-        -webkit-backdrop-filter: blur(20px);
-        border: 1px solid rgba(255,255,255,0.1);
-        border-radius: 16px;
-        padding: 1.25rem;
-        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-    }
-    
-    .metric-card:hover {
-        transform: translateY(-4px);
-        background: linear-gradient(135deg, rgba(255,255,255,0.08) 0%, rgba(255,255,255,0.03) 100%);
-        box-shadow: 0 20px 40px rgba(0,0,0,0.5);
-    }
-    
-    .metric-label {
-        font-size: 11px;
-        font-weight: 600;
-        color: #8e8e93;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-        margin-bottom: 8px;
-    }
-    
-    .metric-value {
-        font-size: 24px;
-        font-weight: 700;
-        color: #ffffff;
-        letter-spacing: -0.02em;
-    }
-    
-    .metric-delta {
-        font-size: 12px;
-        font-weight: 500;
-        margin-top: 4px;
-        color: #8e8e93;
-    }
-    
-    .positive { color: #30d158; }
-    .negative { color: #ff453a; }
-    .neutral { color: #8e8e93; }
-    
-    /* Glass Cards */
-    .glass-card {
-        background: rgba(255,255,255,0.05);
-        backdrop-filter: blur(40px) saturate(180%);
-        -webkit-backdrop-filter: blur(40px) saturate(180%);
-        border: 1px solid rgba(255,255,255,0.1);
-        border-radius: 20px;
-        padding: 1.5rem;
-        margin-bottom: 1.5rem;
-        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-    }
-    
-    .glass-card:hover {
-        background: rgba(255,255,255,0.07);
-        transform: scale(1.01);
-    }
-    
-    /* Section Headers */
-    .section-header {
-        font-size: 18px;
-        font-weight: 600;
-        color: #ffffff;
-        margin: 2rem 0 1rem 0;
-        display: flex;
-        align-items: center;
-        gap: 8px;
-    }
-    
-    .section-header::after {
-        content: '';
-        flex: 1;
-        height: 1px;
-        background: linear-gradient(90deg, rgba(255,255,255,0.2) 0%, transparent 100%);
-    }
-    
-    /* Position Row */
-    .position-row {
-        background: linear-gradient(135deg, rgba(255,255,255,0.05) 0%, transparent 100%);
-        border-radius: 12px;
-        padding: 1rem;
-        margin-bottom: 0.75rem;
-        border: 1px solid rgba(255,255,255,0.08);
-        transition: all 0.2s ease;
-    }
-    
-    .position-row:hover {
-        background: rgba(255,255,255,0.08);
-        transform: translateX(4px);
-    }
-    
-    /* Signal Card */
-    .signal-card {
-        background: rgba(255,255,255,0.03);
-        border-radius: 12px;
-        padding: 1rem;
-        margin-bottom: 0.5rem;
-        border-left: 3px solid;
-        transition: all 0.2s ease;
-    }
-    
-    .signal-long { border-color: #30d158; }
-    .signal-exit { border-color: #ff453a; }
-    .signal-hold { border-color: #8e8e93; }
-    
-    /* Watchlist Grid */
-    .watchlist-container {
-        background: rgba(255,255,255,0.02);
-        border-radius: 20px;
-        padding: 1.5rem;
-        border: 1px solid rgba(255,255,255,0.08);
-    }
-    
-    .watchlist-grid {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(160px, 1fr));
-        gap: 1rem;
-        margin-top: 1rem;
-    }
-    
-    .watchlist-item {
-        background: linear-gradient(135deg, rgba(255,255,255,0.05) 0%, transparent 100%);
-        border-radius: 12px;
-        padding: 1rem;
-        text-align: center;
-        border: 1px solid rgba(255,255,255,0.05);
-        transition: all 0.2s ease;
-    }
-    
-    .watchlist-item:hover {
-        background: rgba(255,255,255,0.08);
-        transform: translateY(-2px);
-    }
-    
-    .watchlist-symbol {
-        font-size: 16px;
-        font-weight: 600;
-        color: #ffffff;
-        margin-bottom: 4px;
-    }
-    
-    .watchlist-price {
-        font-size: 20px;
-        font-weight: 700;
-        color: #8e8e93;
-        margin-bottom: 8px;
-    }
-    
-    .watchlist-status {
-        font-size: 11px;
-        color: #ff9f0a;
-        font-weight: 500;
-    }
-    
     /* Button Styles */
     .stButton > button {
         background: linear-gradient(135deg, rgba(255,255,255,0.1) 0%, rgba(255,255,255,0.05) 100%);
@@ -372,20 +219,30 @@ def convert_to_et(timestamp_str):
 
 def get_market_status():
     now = datetime.now(ET)
-    weekday = now.weekday()
-    current_time = now.time()
+    session = NYSE.session_at(now)
+    day_type = NYSE.day_type(now)
     
-    if weekday >= 5:
+    if session == REGULAR:
+        return "OPEN", "#30d158"
+    elif day_type == WEEKEND:
         return "WEEKEND", "#ff9f0a"
-    elif current_time < datetime.strptime("09:30", "%H:%M").time():
+    elif day_type == HOLIDAY:
+        return "HOLIDAY", "#ff9f0a"
+    elif session == PRE_MARKET:
         return "PRE-MARKET", "#ff9f0a"
-    elif current_time >= datetime.strptime("16:00", "%H:%M").time():
+    elif session == AFTER_HOURS:
         return "AFTER-HOURS", "#8e8e93"
-    elif datetime.strptime("09:30", "%H:%M").time() <= current_time < datetime.strptime("16:00", "%H:%M").time():
-        return "OPEN", "#30d158"
     else:
         return "CLOSED", "#8e8e93"
 
+def get_data_refresh_seconds():
+    """Reload data every REFRESH_SECONDS while any session is live, back off while closed"""
+    now = datetime.now(ET)
+    if NYSE.session_at(now) != CLOSED:
+        return REFRESH_SECONDS
+    until_open = (NYSE.next_session_start(now) - now).total_seconds()
+    return max(REFRESH_SECONDS, min(CLOSED_REFRESH_SECONDS, until_open))
+
 def format_criteria(signal):
     criteria_parts = []
     
@@ -427,17 +284,43 @@ def calculate_metrics(trades):
         'total_trades': len(trades)
     }
 
+@st.cache_resource
+def get_price_tape():
+    """Price snapshots shared by every viewer session, seeded from TAPE_FILE"""
+    return PriceTape(path=TAPE_FILE)
+
+@st.cache_resource
+def get_data_cache():
+    """Last feed load shared by every viewer session"""
+    return {'data': None, 'loaded_at': 0.0, 'lock': threading.Lock()}
+
+def load_all_data(max_age):
+    """All feeds, reloaded at most once per `max_age` seconds per process"""
+    cache = get_data_cache()
+    with cache['lock']:
+        if cache['data'] is None or time.time() - cache['loaded_at'] >= max_age:
+            cache['data'] = (load_status(), load_signals(), load_positions(), load_trades(), load_realtime_prices())
+            cache['loaded_at'] = time.time()
+        return cache['data']
+
+def format_age(seconds):
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+    if seconds < 3600:
+        return f"{seconds / 60:.0f}m"
+    if seconds < 86400:
+        return f"{seconds / 3600:.0f}h"
+    return f"{seconds / 86400:.0f}d"
+
 # Main application
 def main():
     if st.session_state.counter % 10 == 0:
         st.cache_data.clear()
     
-    # Load all data
-    status = load_status()
-    signals = load_signals()
-    positions = load_positions()
-    trades = load_trades()
-    prices = load_realtime_prices()
+    # Load all data; viewers share one load per data_refresh window, so reruns
+    # stay on the REFRESH_SECONDS cadence without each polling the data host
+    data_refresh = get_data_refresh_seconds()
+    status, signals, positions, trades, prices = load_all_data(data_refresh)
     
     # Check connection
     is_connected = False
@@ -464,7 +347,7 @@ def main():
     
     if not status:
         st.info("Waiting for trading system data...")
-        time.sleep(5)
+        time.sleep(REFRESH_SECONDS)
         st.session_state.counter += 1
         st.rerun()
         return
@@ -484,48 +367,25 @@ def main():
                     open_pnl += ((current - entry) / entry * 100)
     
     # Metrics Grid
-    st.markdown("""
-        <div class="metric-grid">
-            <div class="metric-card">
-                <div class="metric-label">Market</div>
-                <div class="metric-value" style="color: """ + market_color + """;">""" + market_status + """</div>
-            </div>
-            <div class="metric-card">
-                <div class="metric-label">Positions</div>
-                <div class="metric-value">""" + str(sum(1 for p in positions.values() if p.get('is_open'))) + """/""" + str(len(ASSETS)) + """</div>
-            </div>
-            <div class="metric-card">
-                <div class="metric-label">Open P&L</div>
-                <div class="metric-value """ + ('class="positive"' if open_pnl > 0 else 'class="negative"' if open_pnl < 0 else '') + """>""" + f"{open_pnl:+.1f}%" + """</div>
-            </div>
-            <div class="metric-card">
-                <div class="metric-label">Total P&L</div>
-                <div class="metric-value """ + ('class="positive"' if metrics['total_pnl'] > 0 else 'class="negative"' if metrics['total_pnl'] < 0 else '') + """>""" + f"{metrics['total_pnl']:+.1f}%" + """</div>
-            </div>
-            <div class="metric-card">
-                <div class="metric-label">Win Rate</div>
-                <div class="metric-value">""" + f"{metrics['win_rate']:.0f}%" + """</div>
-                <div class="metric-delta">""" + f"{metrics['total_trades']} trades" + """</div>
-            </div>
-            <div class="metric-card">
-                <div class="metric-label">Profit Factor</div>
-                <div class="metric-value">""" + f"{metrics['profit_factor']:.2f}" + """</div>
-            </div>
-            <div class="metric-card">
-                <div class="metric-label">Today's Signals</div>
-                <div class="metric-value">""" + str(len(signals) if signals else 0) + """</div>
-            </div>
-        </div>
-    """, unsafe_allow_html=True)
+    open_count = sum(1 for p in positions.values() if p.get('is_open'))
+    metric_rows = {
+        'market': {'order': 0, 'label': "Market", 'value': market_status, 'color': market_color},
+        'positions': {'order': 1, 'label': "Positions", 'value': f"{open_count}/{len(ASSETS)}"},
+        'open_pnl': {'order': 2, 'label': "Open P&L", 'value': f"{open_pnl:+.1f}%", 'tone': "positive" if open_pnl > 0 else "negative" if open_pnl < 0 else None},
+        'total_pnl': {'order': 3, 'label': "Total P&L", 'value': f"{metrics['total_pnl']:+.1f}%",
+                      'tone': "positive" if metrics['total_pnl'] > 0 else "negative" if metrics['total_pnl'] < 0 else None},
+        'win_rate': {'order': 4, 'label': "Win Rate", 'value': f"{metrics['win_rate']:.0f}%",
+                     'delta': f"{metrics['total_trades']} trades"},
+        'profit_factor': {'order': 5, 'label': "Profit Factor", 'value': f"{metrics['profit_factor']:.2f}"},
+        'signals_today': {'order': 6, 'label': "Today's Signals", 'value': str(len(signals) if signals else 0)},
+    }
+    live_board({'metrics': metric_rows}, key="live_metrics")
     
     # Main content with two columns
     col1, col2 = st.columns([2, 1])
     
     with col1:
         # Positions Section
-        st.markdown('<div class="section-header">📊 Active Positions</div>', unsafe_allow_html=True)
-        
-        positions_html = '<div class="glass-card">'
         latest_signals = {}
         
         for sig in signals:
@@ -533,10 +393,9 @@ def main():
             if sym and (sym not in latest_signals or sig['timestamp'] > latest_signals[sym]['timestamp']):
                 latest_signals[sym] = sig
         
-        active_count = 0
-        for symbol in ASSETS:
+        position_rows = {}
+        for order, symbol in enumerate(ASSETS):
             if symbol in positions and positions[symbol].get('is_open'):
-                active_count += 1
                 pos = positions[symbol]
                 
                 current_price = prices.get('prices', {}).get(symbol, 0)
@@ -556,93 +415,78 @@ def main():
                     except:
                         pass
                 
-                criteria = format_criteria(latest_signals[symbol]) if symbol in latest_signals else "Standard"
-                pnl_color = "positive" if pnl_pct > 0 else "negative"
-                
-                positions_html += f"""
-                    <div class="position-row">
-                        <div style="display: flex; justify-content: space-between; align-items: center;">
-                            <div>
-                                <div style="font-size: 16px; font-weight: 600; color: white; margin-bottom: 4px;">{symbol}</div>
-                                <div style="font-size: 12px; color: #8e8e93;">Entry: ${entry_price:.2f} • {entry_time}</div>
-                                <div style="font-size: 11px; color: #636366; margin-top: 4px;">{criteria}</div>
-                            </div>
-                            <div style="text-align: right;">
-                                <div style="font-size: 18px; font-weight: 700; color: white;">${current_price:.2f}</div>
-                                <div class="{pnl_color}" style="font-size: 14px; font-weight: 600;">{pnl_pct:+.1f}% • ${pnl_usd:+.0f}</div>
-                            </div>
-                        </div>
-                    </div>
-                """
-        
-        if active_count == 0:
-            positions_html += '<div style="text-align: center; color: #8e8e93; padding: 2rem;">No active positions</div>'
-        
-        positions_html += '</div>'
-        st.markdown(positions_html, unsafe_allow_html=True)
+                position_rows[symbol] = {
+                    'order': order,
+                    'symbol': symbol,
+                    'entry': f"Entry: ${entry_price:.2f} • {entry_time}",
+                    'criteria': format_criteria(latest_signals[symbol]) if symbol in latest_signals else "Standard",
+                    'price': f"${current_price:.2f}",
+                    'pnl': f"{pnl_pct:+.1f}% • ${pnl_usd:+.0f}",
+                    'tone': "positive" if pnl_pct > 0 else "negative",
+                }
         
         # Recent Signals
-        st.markdown('<div class="section-header">📡 Recent Signals</div>', unsafe_allow_html=True)
-        
-        if signals:
-            recent = sorted(signals, key=lambda x: x['timestamp'], reverse=True)[:5]
-            signals_html = ""
+        signal_rows = {}
+        recent_signals = sorted(signals, key=lambda x: x['timestamp'], reverse=True)[:5]
+        recent_sessions = NYSE.label_sessions([s['timestamp'] for s in recent_signals])
+        for sig, session in zip(recent_signals, recent_sessions):
+            sig_time = convert_to_et(sig['timestamp'])
+            action_class = "signal-long" if sig['action'] == 'LONG' else "signal-exit" if sig['action'] == 'EXIT' else "signal-hold"
+            action_emoji = "🟢" if sig['action'] == 'LONG' else "🔴" if sig['action'] == 'EXIT' else "⚪"
             
-            for sig in recent:
-                sig_time = convert_to_et(sig['timestamp'])
-                action_class = "signal-long" if sig['action'] == 'LONG' else "signal-exit" if sig['action'] == 'EXIT' else "signal-hold"
-                action_emoji = "🟢" if sig['action'] == 'LONG' else "🔴" if sig['action'] == 'EXIT' else "⚪"
-                
-                signals_html += f"""
-                    <div class="signal-card {action_class}">
-                        <div style="display: flex; justify-content: space-between; align-items: center;">
-                            <div>
-                                <span style="font-size: 14px; font-weight: 600;">{action_emoji} {sig['symbol']} • {sig['action']}</span>
-                                <span style="font-size: 12px; color: #8e8e93; margin-left: 12px;">${sig['price']:.2f}</span>
-                            </div>
-                            <div style="font-size: 11px; color: #636366;">{sig_time.strftime('%H:%M:%S')}</div>
-                        </div>
-                    </div>
-                """
-            
-            
-            if signals:
-                recent = sorted(signals, key=lambda x: x['timestamp'], reverse=True)[:5]
-                for sig in recent:
-                    sig_time = convert_to_et(sig['timestamp'])
-                    action_class = "signal-long" if sig['action'] == 'LONG' else "signal-exit" if sig['action'] == 'EXIT' else "signal-hold"
-                    action_emoji = "🟢" if sig['action'] == 'LONG' else "🔴" if sig['action'] == 'EXIT' else "⚪"
-                    
-                    signals_html += f"""
-                        <div class="signal-card {action_class}">
-                            <div style="display: flex; justify-content: space-between; align-items: center;">
-                                <div>
-                                    <span style="font-size: 14px; font-weight: 600;">{action_emoji} {sig['symbol']} • {sig['action']}</span>
-                                    <span style="font-size: 12px; color: #8e8e93; margin-left: 12px;">${sig['price']:.2f}</span>
-                                </div>
-                                <div style="font-size: 11px; color: #636366;">{sig_time.strftime('%H:%M:%S')}</div>
-                            </div>
-                        </div>
-                    """
-                
-                st.markdown(signals_html, unsafe_allow_html=True)
-            else:
-                st.markdown('<div class="glass-card" style="text-align: center; color: #8e8e93;">No signals today</div>', unsafe_allow_html=True)
+            signal_rows[f"{sig['timestamp']}|{sig['symbol']}"] = {
+                'order': -sig_time.timestamp(),
+                'kind': action_class,
+                'title': f"{action_emoji} {sig['symbol']} • {sig['action']}",
+                'price': f"${sig['price']:.2f}",
+                'time': sig_time.strftime('%H:%M:%S'),
+                'session': session,
+            }
+        
+        live_board({'positions': position_rows, 'signals': signal_rows}, key="live_positions")
     
     with col2:
         # Watchlist Section
         st.markdown("### 👁 Watchlist")
         
-        watchlist_cols = st.columns(2)
+        feed = prices.get('prices', {})
+        tape = get_price_tape()
+        tape.record(prices.get('timestamp'), feed)
+        movers = rank_movers(scan_universe(feed, signals, tape), WATCHLIST_SIZE)
+        
+        baseline = tape.baseline_timestamp
+        if baseline is None:
+            st.caption("Waiting for the first price snapshot")
+        else:
+            age = format_age((datetime.now(pytz.UTC) - baseline).total_seconds())
+            caption = f"Change vs {baseline.astimezone(ET).strftime('%a %H:%M')} ET ({age} ago)"
+            if baseline == tape.last_timestamp:
+                caption += " • waiting for the feed to update"
+            st.caption(caption)
         
-        for idx, symbol in enumerate(WATCHLIST):
-            price = prices.get('prices', {}).get(symbol, 0)
-            price_display = f"${price:.2f}" if price > 0 else "---"
+        groups = [
+            ("Top Gainers", movers['gainers'], "normal"),
+            ("Top Losers", movers['losers'], "normal"),
+            ("Most Signalled", movers['signalled'], "off"),
+        ]
+        for title, rows, delta_color in groups:
+            st.markdown(f"**{title}**")
+            if rows.empty:
+                st.caption("No movers yet")
+                continue
             
-            with watchlist_cols[idx % 2]:
-                with st.container():
-                    st.markdown(f"**{symbol}**")
-                    st.metric(label="", value=price_display, delta="Monitoring", delta_color="off")
+            watchlist_cols = st.columns(2)
+            for idx, row in enumerate(rows.itertuples()):
+                price_display = f"${row.price:.2f}" if row.price > 0 else "---"
+                if delta_color == "off":
+                    delta = f"{row.signals} signals • {row.longs}L/{row.exits}X"
+                else:
+                    delta = f"{row.change_pct:+.2f}%"
+                    if not np.isnan(row.range_pos):
+                        delta += f" • {row.range_pos:.0%} of range"
+                
+                with watchlist_cols[idx % 2]:
+                    st.metric(label=row.symbol, value=price_display, delta=delta, delta_color=delta_color)
                     
         st.divider()
     
@@ -701,15 +545,43 @@ def main():
                         height=300
                     )
                     st.plotly_chart(fig, use_container_width=True)
+            
+            # P&L by session
+            if 'entry_time' in df_trades.columns:
+                df_trades['session'] = NYSE.label_sessions(df_trades['entry_time'])
+                by_session = df_trades.groupby('session')['pnl_percent'].agg(
+                    ['count', lambda x: (x > 0).mean() * 100, 'sum', 'mean']
+                ).reset_index()
+                by_session.columns = ['Session', 'Trades', 'Win Rate', 'Total P&L', 'Avg P&L']
+                by_session['Win Rate'] = by_session['Win Rate'].apply(lambda x: f"{x:.0f}%")
+                for col in ['Total P&L', 'Avg P&L']:
+                    by_session[col] = by_session[col].apply(lambda x: f"{x:+.1f}%")
+                
+                st.markdown("#### P&L by Session")
+                st.dataframe(by_session, use_container_width=True, hide_index=True)
         else:
             st.info("No performance data available")
+        
+        # Today's signals by session
+        if signals:
+            df_signals = pd.DataFrame(signals, columns=['timestamp', 'action'])
+            df_signals['session'] = NYSE.label_sessions(df_signals['timestamp'])
+            signals_by_session = pd.crosstab(df_signals['session'], df_signals['action'])
+            signals_by_session = signals_by_session.reindex(columns=['LONG', 'EXIT'], fill_value=0)
+            signals_by_session.insert(0, 'Signals', df_signals['session'].value_counts())
+            signals_by_session = signals_by_session.reset_index()
+            signals_by_session.columns = ['Session', 'Signals', 'Long', 'Exit']
+            
+            st.markdown("#### Signals by Session")
+            st.dataframe(signals_by_session, use_container_width=True, hide_index=True)
     
     with tab2:
         if trades:
             df_display = pd.DataFrame(trades).sort_values('exit_time', ascending=False).head(15)
+            df_display['session'] = NYSE.label_sessions(df_display['entry_time'])
             df_display['exit_time'] = pd.to_datetime(df_display['exit_time']).dt.strftime('%m/%d %H:%M')
-            df_display = df_display[['symbol', 'exit_time', 'entry_price', 'exit_price', 'pnl_percent', 'pnl_dollar']]
-            df_display.columns = ['Symbol', 'Exit Time', 'Entry', 'Exit', 'P&L (%)', 'P&L ($)']
+            df_display = df_display[['symbol', 'session', 'exit_time', 'entry_price', 'exit_price', 'pnl_percent', 'pnl_dollar']]
+            df_display.columns = ['Symbol', 'Session', 'Exit Time', 'Entry', 'Exit', 'P&L (%)', 'P&L ($)']
             
             for col in ['Entry', 'Exit']:
                 df_display[col] = df_display[col].apply(lambda x: f"${x:.2f}")
@@ -722,10 +594,11 @@ def main():
     
     # Footer
     st.markdown("---")
-    st.caption(f"Auto-refresh: 5 seconds • Last update: {datetime.now().strftime('%H:%M:%S')}")
+    st.caption(f"Auto-refresh: {REFRESH_SECONDS} seconds • Data every {data_refresh:.0f} seconds • "
+               f"Last update: {datetime.now().strftime('%H:%M:%S')}")
     
     # Auto refresh
-    time.sleep(5)
+    time.sleep(REFRESH_SECONDS)
     st.session_state.counter += 1
     st.rerun()
 